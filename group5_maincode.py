@@ -1,72 +1,285 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import functools
+import itertools
 import json
+import math
 import os
+import re
+from collections import defaultdict
 from datetime import date
-import matplotlib
-matplotlib.use("TkAgg")
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=4).encode()
+
+    _loads = json.loads
+
+_AMT_RE = re.compile(r'^\s*(?:\d+(?:\.\d*)?|\.\d+)\s*$')
+
+def _parse_amount(text):
+    """Return text as a positive finite float, or None if it is not a valid amount."""
+    if not _AMT_RE.match(text):
+        return None
+    amt = float(text)  # very long digit strings overflow to inf
+    return amt if math.isfinite(amt) and amt > 0 else None
+
+def group_sum(keys, amounts):
+    """Sum amounts per distinct key. Returns (sorted keys, sums)."""
+    import numpy as np
+    labels, codes = np.unique(np.asarray(keys), return_inverse=True)
+    sums = np.bincount(codes, weights=np.asarray(amounts, dtype=np.float64), minlength=labels.size)
+    return labels.tolist(), sums
+
+def _loaded_attr(name):
+    """Read-only FinanceManager attribute that loads the data file on first access."""
+    def get(self):
+        self._ensure_loaded()
+        return getattr(self, name)
+    return property(get)
 
 class FinanceManager:
     DATA_FILE = 'finance_data.json'
 
     def __init__(self, file_path=None):
         self.file_path = file_path or self.DATA_FILE
+        self._dirty = False
+        self._save_failed = False
+        self._failed_rev = -1
+        self._loaded = False
+        self._stdlib_json = False
+        self._keep_file = False
+        # Bumped on every change so frames can skip redrawing unchanged data
+        self.rev = 0
+
+    def _ensure_loaded(self):
+        # The data file is parsed the first time it is needed, not at startup
+        if not self._loaded:
+            self._load()
+            self._loaded = True
+
+    data = _loaded_attr('_data')
+    inc_cats = _loaded_attr('_inc_cats')
+    inc_amounts = _loaded_attr('_inc_amounts')
+    inc_dates = _loaded_attr('_inc_dates')
+    exp_cats = _loaded_attr('_exp_cats')
+    exp_amounts = _loaded_attr('_exp_amounts')
+    exp_dates = _loaded_attr('_exp_dates')
+
+    def _load(self):
+        needs_save = False
         if os.path.exists(self.file_path):
             try:
-                with open(self.file_path, 'r') as f:
-                    self.data = json.load(f)
+                with open(self.file_path, 'rb') as f:
+                    raw = f.read()
+                try:
+                    self._data = _loads(raw)
+                except ValueError:
+                    # orjson rejects the NaN/Infinity older saves may hold and would write
+                    # them back as null, so this file stays on the stdlib parser and writer
+                    self._data = json.loads(raw)
+                    self._stdlib_json = True
                 for key in ['incomes', 'expenses', 'budgets', 'goals']:
-                    val = self.data.get(key, None)
+                    val = self._data.get(key, None)
                     if not isinstance(val, list):
-                        self.data[key] = [val] if isinstance(val, dict) else []
+                        self._data[key] = [val] if isinstance(val, dict) else []
+                # Inside the try so malformed records are handled like an unparseable file
+                self._build_indexes()
             except Exception:
-                self.data = {"incomes": [], "expenses": [], "budgets": [], "goals": []}
-                self.save_data()
+                # Keep the unreadable file for recovery instead of saving over it
+                # Never overwrite an earlier recovery copy: .bak, then .bak1, .bak2, ...
+                backup = self.file_path + '.bak'
+                n = 1
+                while os.path.exists(backup):
+                    backup = f"{self.file_path}.bak{n}"
+                    n += 1
+                try:
+                    os.replace(self.file_path, backup)
+                    messagebox.showwarning("Load Error",
+                                           f"Could not read {self.file_path}; it was moved to {backup}.")
+                except OSError as e:
+                    messagebox.showwarning("Load Error", f"Could not read {self.file_path}: {e}")
+                    self._keep_file = True
+                self._data = {"incomes": [], "expenses": [], "budgets": [], "goals": []}
+                self._build_indexes()
         else:
-            self.data = {"incomes": [], "expenses": [], "budgets": [], "goals": []}
+            self._data = {"incomes": [], "expenses": [], "budgets": [], "goals": []}
+            self._build_indexes()
+            needs_save = True
+        if needs_save:
             self.save_data()
 
+    def _build_indexes(self):
+        self._load_transactions()
+        self._rebuild_totals()
+        self._rebuild_budgets()
+
+    def _load_transactions(self):
+        # Incomes/expenses live in parallel lists; the file keeps the list-of-dicts schema
+        incomes = self._data.pop('incomes')
+        expenses = self._data.pop('expenses')
+        self._inc_cats = [item.get("category", "") for item in incomes]
+        self._inc_amounts = [item.get("amount", 0) for item in incomes]
+        self._inc_dates = [item.get("date") for item in incomes]
+        self._exp_cats = [item.get("category", "") for item in expenses]
+        self._exp_amounts = [item.get("amount", 0) for item in expenses]
+        self._exp_dates = [item.get("date") for item in expenses]
+        self._cats = set(self._inc_cats).union(self._exp_cats)
+
+    @staticmethod
+    def _to_records(cats, amounts, dates):
+        records = []
+        for cat, amt, day in zip(cats, amounts, dates):
+            entry = {"category": cat, "amount": amt}
+            if day is not None:
+                entry["date"] = day
+            records.append(entry)
+        return records
+
+    def _rebuild_totals(self):
+        # Running totals so summary lookups don't rescan every transaction
+        self._total_income = sum(self._inc_amounts)
+        self._total_expense = sum(self._exp_amounts)
+        self._cat_expense = defaultdict(float)
+        for cat, amt in zip(self._exp_cats, self._exp_amounts):
+            self._cat_expense[cat] += amt
+
+    def _rebuild_budgets(self):
+        # First budget set for a normalized category wins, as before
+        self._budget_by_cat = {}
+        for b in self._data["budgets"]:
+            self._budget_by_cat.setdefault(self.normalize_category(b["category"]), b["amount"])
+
+    def _has_non_finite(self):
+        # orjson silently writes inf/nan as null; only the stdlib keeps them
+        records = itertools.chain(self._data["budgets"], self._data["goals"])
+        amounts = itertools.chain(self._inc_amounts, self._exp_amounts,
+                                  (r.get("amount") for r in records if isinstance(r, dict)))
+        return any(isinstance(a, float) and not math.isfinite(a) for a in amounts)
+
     def save_data(self):
+        tmp_path = self.file_path + '.tmp'
         try:
-            with open(self.file_path, 'w') as f:
-                json.dump(self.data, f, indent=4)
+            if self._keep_file:
+                raise OSError(f"{self.file_path} could not be read, so it will not be overwritten")
+            out = {
+                "incomes": self._to_records(self._inc_cats, self._inc_amounts, self._inc_dates),
+                "expenses": self._to_records(self._exp_cats, self._exp_amounts, self._exp_dates),
+                **self._data,
+            }
+            if not self._stdlib_json and self._has_non_finite():
+                self._stdlib_json = True
+            data = json.dumps(out, indent=4).encode() if self._stdlib_json else _dumps(out)
+            # Write beside the real file and rename over it, so a crash never leaves it half-written
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.file_path)
+            self._dirty = False
+            self._save_failed = False
+            return True
         except Exception as e:
-            messagebox.showerror("Save Error", f"Could not save data: {e}")
-
-    def normalize_category(self, name):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            # Report a failing save once, not on every retry
+            if not self._save_failed:
+                messagebox.showerror("Save Error", f"Could not save data: {e}")
+            self._save_failed = True
+            self._failed_rev = self.rev
+            return False
+
+    def mark_dirty(self):
+        # Defer the write; the app flushes on an idle timer and on close
+        self._dirty = True
+        self.rev += 1
+
+    def flush(self, retry_failed=True):
+        """Write pending changes to disk, if there are any. Returns False if they could not be saved."""
+        if not self._dirty:
+            return True
+        # Without retry_failed, a save that already failed is only retried once the data changes
+        if not retry_failed and self.rev == self._failed_rev:
+            return False
+        return self.save_data()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def normalize_category(name):
         # Capitalize first letter, rest lower
         return name.strip().capitalize()
     
     def get_category_expense(self, category):
-        return sum(e["amount"] for e in self.data.get("expenses", []) if e["category"] == category)
+        self._ensure_loaded()
+        return self._cat_expense.get(category, 0)
 
     def add_income(self, category, amount):
-        entry = {"category": category, "amount": amount, "date": date.today().isoformat()}
-        self.data['incomes'].append(entry)
-        self.save_data()
+        self.add_income_many([(category, amount)])
 
     def add_expense(self, category, amount):
-        entry = {"category": category, "amount": amount, "date": date.today().isoformat()}
-        self.data['expenses'].append(entry)
-        self.save_data()
+        self.add_expense_many([(category, amount)])
+
+    def add_income_many(self, items):
+        self._ensure_loaded()
+        # items are (category, amount) pairs; today's date is looked up once per batch
+        today = date.today().isoformat()
+        for category, amount in items:
+            self._inc_cats.append(category)
+            self._inc_amounts.append(amount)
+            self._inc_dates.append(today)
+            self._cats.add(category)
+            self._total_income += amount
+        self.mark_dirty()
+
+    def add_expense_many(self, items):
+        self._ensure_loaded()
+        today = date.today().isoformat()
+        for category, amount in items:
+            self._exp_cats.append(category)
+            self._exp_amounts.append(amount)
+            self._exp_dates.append(today)
+            self._cats.add(category)
+            self._total_expense += amount
+            self._cat_expense[category] += amount
+        self.mark_dirty()
 
     def add_budget(self, category, amount):
+        self._ensure_loaded()
         entry = {"category": category, "amount": amount}
-        self.data['budgets'].append(entry)
-        self.save_data()
+        self._data['budgets'].append(entry)
+        self._budget_by_cat.setdefault(self.normalize_category(category), amount)
+        self.mark_dirty()
 
     def add_goal(self, name, amount):
+        self._ensure_loaded()
         entry = {"name": name, "amount": amount}
-        self.data['goals'].append(entry)
-        self.save_data()
+        self._data['goals'].append(entry)
+        self.mark_dirty()
+
+    def get_budget(self, norm_cat):
+        self._ensure_loaded()
+        return self._budget_by_cat.get(norm_cat, 0)
+
+    def delete_budgets(self):
+        self._ensure_loaded()
+        self._data['budgets'] = []
+        self._budget_by_cat.clear()
+        self.mark_dirty()
 
     def get_total_income(self):
-        return sum(item.get("amount", 0) for item in self.data.get("incomes", []))
+        self._ensure_loaded()
+        return self._total_income
 
     def get_total_expense(self):
-        return sum(item.get("amount", 0) for item in self.data.get("expenses", []))
+        self._ensure_loaded()
+        return self._total_expense
 
     def get_available_funds(self):
         return self.get_total_income() - self.get_total_expense()
@@ -75,41 +288,65 @@ class FinanceManager:
         return amount <= self.get_available_funds()
 
     def categories(self):
-        cats = set()
-        for inc in self.data.get("incomes", []):
-            cats.add(inc.get("category", ""))
-        for exp in self.data.get("expenses", []):
-            cats.add(exp.get("category", ""))
-        return sorted(cats)
+        self._ensure_loaded()
+        return sorted(self._cats)
+
+    def clear_transactions(self):
+        self._ensure_loaded()
+        for values in (self._inc_cats, self._inc_amounts, self._inc_dates,
+                       self._exp_cats, self._exp_amounts, self._exp_dates, self._cats):
+            values.clear()
+        self._rebuild_totals()
+        self.mark_dirty()
 
     def delete_goal(self, index):
+        self._ensure_loaded()
         try:
-            del self.data['goals'][index]
-            self.save_data()
+            del self._data['goals'][index]
+            self.mark_dirty()
         except (IndexError, KeyError):
             pass
 
     def achieve_goal(self, index):
+        self._ensure_loaded()
         try:
-            goal = self.data['goals'][index]
-            del self.data['goals'][index]
-            self.save_data()
+            goal = self._data['goals'][index]
+            del self._data['goals'][index]
+            self.mark_dirty()
             return goal
         except (IndexError, KeyError):
             return None
 
     def achieve_all_goals(self):
-        achieved_goals = list(self.data['goals'])
-        self.data['goals'].clear()
-        self.save_data()
-        return achieved_goals
+        self._ensure_loaded()
+        # Single pass: affordable goals become expenses, the rest are kept
+        balance = self.get_available_funds()
+        achieved, not_achieved, remaining, expenses = [], [], [], []
+        for goal in self._data['goals']:
+            goal_name = goal.get('name') if isinstance(goal, dict) and 'name' in goal else str(goal)
+            goal_amt = goal.get('amount') if isinstance(goal, dict) and 'amount' in goal else 0
+            if goal_amt <= balance:
+                expenses.append((f'Goal ("{goal_name}")', goal_amt))
+                balance -= goal_amt
+                achieved.append(goal_name)
+            else:
+                remaining.append(goal)
+                not_achieved.append(goal_name)
+        if expenses:
+            # add_expense_many marks the change once for both the goals and the expenses
+            self._data['goals'] = remaining
+            self.add_expense_many(expenses)
+        return achieved, not_achieved
 
     def delete_all_goals(self):
-        self.data['goals'].clear()
-        self.save_data()
+        self._ensure_loaded()
+        self._data['goals'].clear()
+        self.mark_dirty()
 
 class FinanceFlowApp(tk.Tk):
     """Main application class managing frames and navigation."""
+    AUTOSAVE_MS = 500
+
     def __init__(self):
         super().__init__()
         self.title("FinanceFlow")
@@ -118,22 +355,34 @@ class FinanceFlowApp(tk.Tk):
 
         self.manager = FinanceManager()
 
-        container = ttk.Frame(self)
-        container.pack(fill='both', expand=True)
-        container.grid_rowconfigure(0, weight=1)
-        container.grid_columnconfigure(0, weight=1)
+        self.container = ttk.Frame(self)
+        self.container.pack(fill='both', expand=True)
+        self.container.grid_rowconfigure(0, weight=1)
+        self.container.grid_columnconfigure(0, weight=1)
 
+        # Frames are built on first visit so startup only pays for the main menu
         self.frames = {}
-        for F in (MainMenuFrame, IncomeFrame, ExpenseFrame, BudgetFrame,
-                  GoalFrame, CategorySummaryFrame, SummaryFrame, PieChartFrame):
-            frame = F(parent=container, controller=self)
-            self.frames[F] = frame
-            frame.grid(row=0, column=0, sticky='nsew')
-
         self.show_frame(MainMenuFrame)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.after(self.AUTOSAVE_MS, self.autosave)
+
+    def autosave(self):
+        """Write any pending changes, then reschedule."""
+        self.manager.flush(retry_failed=False)
+        self.after(self.AUTOSAVE_MS, self.autosave)
+
+    def on_close(self):
+        """Save pending changes before closing the window; ask before discarding them."""
+        if self.manager.flush() or messagebox.askyesno(
+                "Unsaved Changes", "Your changes could not be saved. Quit anyway and lose them?"):
+            self.destroy()
 
     def show_frame(self, frame_class):
-        frame = self.frames[frame_class]
+        frame = self.frames.get(frame_class)
+        if frame is None:
+            frame = frame_class(parent=self.container, controller=self)
+            self.frames[frame_class] = frame
+            frame.grid(row=0, column=0, sticky='nsew')
         if hasattr(frame, 'refresh'):
             frame.refresh()
         frame.tkraise()
@@ -148,20 +397,20 @@ class MainMenuFrame(ttk.Frame):
         label.pack(pady=20)
 
         ttk.Button(self, text="Add Income", 
-                   command=lambda: controller.show_frame(IncomeFrame)).pack(fill='x', padx=100, pady=5)
+                   command=functools.partial(controller.show_frame, IncomeFrame)).pack(fill='x', padx=100, pady=5)
         ttk.Button(self, text="Add Expense", 
-                   command=lambda: controller.show_frame(ExpenseFrame)).pack(fill='x', padx=100, pady=5)
+                   command=functools.partial(controller.show_frame, ExpenseFrame)).pack(fill='x', padx=100, pady=5)
         ttk.Button(self, text="Set Budget", 
-                   command=lambda: controller.show_frame(BudgetFrame)).pack(fill='x', padx=100, pady=5)
+                   command=functools.partial(controller.show_frame, BudgetFrame)).pack(fill='x', padx=100, pady=5)
         ttk.Button(self, text="Set Goal", 
-                   command=lambda: controller.show_frame(GoalFrame)).pack(fill='x', padx=100, pady=5)
+                   command=functools.partial(controller.show_frame, GoalFrame)).pack(fill='x', padx=100, pady=5)
         ttk.Button(self, text="Category Summary", 
-                   command=lambda: controller.show_frame(CategorySummaryFrame)).pack(fill='x', padx=100, pady=5)
+                   command=functools.partial(controller.show_frame, CategorySummaryFrame)).pack(fill='x', padx=100, pady=5)
         ttk.Button(self, text="Summary View", 
-                   command=lambda: controller.show_frame(SummaryFrame)).pack(fill='x', padx=100, pady=5)
+                   command=functools.partial(controller.show_frame, SummaryFrame)).pack(fill='x', padx=100, pady=5)
         ttk.Button(self, text="Pie Chart (Expenses)", 
-                   command=lambda: controller.show_frame(PieChartFrame)).pack(fill='x', padx=100, pady=5)
-        ttk.Button(self, text="Quit", command=controller.destroy).pack(fill='x', padx=100, pady=20)
+                   command=functools.partial(controller.show_frame, PieChartFrame)).pack(fill='x', padx=100, pady=5)
+        ttk.Button(self, text="Quit", command=controller.on_close).pack(fill='x', padx=100, pady=20)
 
 class IncomeFrame(ttk.Frame):
     """Frame for adding an income (category + amount)."""
@@ -182,7 +431,7 @@ class IncomeFrame(ttk.Frame):
 
         ttk.Button(self, text="Add", command=self.add_income).pack(pady=5)
         ttk.Button(self, text="Back to Main Menu", 
-                   command=lambda: controller.show_frame(MainMenuFrame)).pack(pady=5)
+                   command=functools.partial(controller.show_frame, MainMenuFrame)).pack(pady=5)
 
     def add_income(self):
         cat = self.entry_cat.get().strip()
@@ -190,11 +439,8 @@ class IncomeFrame(ttk.Frame):
         if not cat:
             messagebox.showerror("Input Error", "Category cannot be empty.")
             return
-        try:
-            amt = float(amt_str)
-            if amt <= 0:
-                raise ValueError
-        except ValueError:
+        amt = _parse_amount(amt_str)
+        if amt is None:
             messagebox.showerror("Input Error", "Enter a valid positive number for amount.")
             return
 
@@ -223,7 +469,7 @@ class ExpenseFrame(ttk.Frame):
 
         ttk.Button(self, text="Add", command=self.add_expense).pack(pady=5)
         ttk.Button(self, text="Back to Main Menu", 
-                   command=lambda: controller.show_frame(MainMenuFrame)).pack(pady=5)
+                   command=functools.partial(controller.show_frame, MainMenuFrame)).pack(pady=5)
 
     def add_expense(self):
         cat = self.entry_cat.get().strip()
@@ -231,11 +477,8 @@ class ExpenseFrame(ttk.Frame):
         if not cat:
             messagebox.showerror("Input Error", "Category cannot be empty.")
             return
-        try:
-            amt = float(amt_str)
-            if amt <= 0:
-                raise ValueError
-        except ValueError:
+        amt = _parse_amount(amt_str)
+        if amt is None:
             messagebox.showerror("Input Error", "Enter a valid positive number for amount.")
             return
 
@@ -249,8 +492,7 @@ class ExpenseFrame(ttk.Frame):
             )
             return
 
-        budgets = self.controller.manager.data.get("budgets", [])
-        budget_amt = next((b["amount"] for b in budgets if self.controller.manager.normalize_category(b["category"]) == norm_cat), 0)
+        budget_amt = self.controller.manager.get_budget(norm_cat)
         if budget_amt > 0:
             current_spent = self.controller.manager.get_category_expense(norm_cat)
             if current_spent + amt > budget_amt:
@@ -285,7 +527,7 @@ class BudgetFrame(ttk.Frame):
 
         ttk.Button(self, text="Set Budget", command=self.set_budget).pack(pady=5)
         ttk.Button(self, text="Back to Main Menu", 
-                   command=lambda: controller.show_frame(MainMenuFrame)).pack(pady=5)
+                   command=functools.partial(controller.show_frame, MainMenuFrame)).pack(pady=5)
 
     def set_budget(self):
         cat = self.entry_cat.get().strip()
@@ -293,11 +535,8 @@ class BudgetFrame(ttk.Frame):
         if not cat:
             messagebox.showerror("Input Error", "Category cannot be empty.")
             return
-        try:
-            amt = float(amt_str)
-            if amt <= 0:
-                raise ValueError
-        except ValueError:
+        amt = _parse_amount(amt_str)
+        if amt is None:
             messagebox.showerror("Input Error", "Enter a valid positive number for amount.")
             return
 
@@ -326,7 +565,7 @@ class GoalFrame(ttk.Frame):
 
         ttk.Button(self, text="Set Goal", command=self.set_goal).pack(pady=5)
         ttk.Button(self, text="Back to Main Menu", 
-                   command=lambda: controller.show_frame(MainMenuFrame)).pack(pady=5)
+                   command=functools.partial(controller.show_frame, MainMenuFrame)).pack(pady=5)
 
     def set_goal(self):
         name = self.entry_name.get().strip()
@@ -334,11 +573,8 @@ class GoalFrame(ttk.Frame):
         if not name:
             messagebox.showerror("Input Error", "Goal name cannot be empty.")
             return
-        try:
-            amt = float(amt_str)
-            if amt <= 0:
-                raise ValueError
-        except ValueError:
+        amt = _parse_amount(amt_str)
+        if amt is None:
             messagebox.showerror("Input Error", "Enter a valid positive number for amount.")
             return
 
@@ -353,6 +589,7 @@ class CategorySummaryFrame(ttk.Frame):
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
+        self._last_rev = -1
 
         ttk.Label(self, text="Category Summary", font=("Helvetica", 14)).pack(pady=10)
         columns = ("category", "income", "expense", "latest_date")
@@ -369,35 +606,36 @@ class CategorySummaryFrame(ttk.Frame):
 
         ttk.Button(self, text="Clear Transactions", command=self.clear_transactions).pack(pady=5)
         ttk.Button(self, text="Back to Main Menu", 
-                   command=lambda: controller.show_frame(MainMenuFrame)).pack(pady=5)
+                   command=functools.partial(controller.show_frame, MainMenuFrame)).pack(pady=5)
 
     def refresh(self):
         """Refresh the category summary table, including latest transaction date."""
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        cats = self.controller.manager.categories()
-        for cat in cats:
-            inc_total = sum(item["amount"] 
-                            for item in self.controller.manager.data["incomes"] if item["category"] == cat)
-            exp_total = sum(item["amount"] 
-                            for item in self.controller.manager.data["expenses"] if item["category"] == cat)
-            # Find latest date for this category
-            dates = []
-            for item in self.controller.manager.data["incomes"]:
-                if item["category"] == cat and "date" in item:
-                    dates.append(item["date"])
-            for item in self.controller.manager.data["expenses"]:
-                if item["category"] == cat and "date" in item:
-                    dates.append(item["date"])
-            latest_date = max(dates) if dates else "-"
+        if self._last_rev == self.controller.manager.rev:
+            return
+        self._last_rev = self.controller.manager.rev
+        self.tree.delete(*self.tree.get_children())
+        manager = self.controller.manager
+        # One pass over each list, grouping totals and latest date by category
+        inc_sum = defaultdict(float)
+        exp_sum = defaultdict(float)
+        latest = {}
+        for cats, amounts, dates, sums in (
+                (manager.inc_cats, manager.inc_amounts, manager.inc_dates, inc_sum),
+                (manager.exp_cats, manager.exp_amounts, manager.exp_dates, exp_sum)):
+            for cat, amt, day in zip(cats, amounts, dates):
+                sums[cat] += amt
+                if day is not None:
+                    latest[cat] = max(latest.get(cat, ""), day)
+        for cat in manager.categories():
+            inc_total = inc_sum.get(cat, 0)
+            exp_total = exp_sum.get(cat, 0)
+            latest_date = latest.get(cat, "-")
             self.tree.insert("", "end", values=(cat, f"RM {inc_total:.2f}", f"{exp_total:.2f}", latest_date))
 
     def clear_transactions(self):
         """Clear all incomes and expenses after confirmation."""
         if messagebox.askyesno("Confirm", "Clear ALL incomes and expenses?"):
-            self.controller.manager.data['incomes'] = []
-            self.controller.manager.data['expenses'] = []
-            self.controller.manager.save_data()
+            self.controller.manager.clear_transactions()
             self.refresh()
             messagebox.showinfo("Cleared", "All incomes and expenses have been cleared.")
     
@@ -406,27 +644,51 @@ class SummaryFrame(ttk.Frame):
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
+        self._last_rev = -1
 
         ttk.Label(self, text="Financial Summary", font=("Helvetica", 14)).pack(pady=10)
         self.summary_text = tk.Text(self, width=50, height=10, state='disabled')
         self.summary_text.pack(padx=10, pady=10)
 
-        # Frame for goals and their buttons
+        # Goals table; rows are plain data, the buttons below act on the selection
         self.goals_frame = tk.LabelFrame(self, text="Goals")
         self.goals_frame.pack(fill="x", pady=10)
-
-        # Frame for Achieve All / Delete All buttons
+        self.goals_tree = ttk.Treeview(self.goals_frame, columns=("name", "amount"),
+                                       show='headings', height=3, selectmode='browse')
+        self.goals_tree.heading("name", text="Goal")
+        self.goals_tree.heading("amount", text="Amount")
+        self.goals_tree.column("name", width=200, anchor="w")
+        self.goals_tree.column("amount", width=100, anchor="center")
+        self.goals_tree.pack(fill="x", padx=5, pady=2)
+        self.goals_tree.bind("<<TreeviewSelect>>", self.update_goal_buttons)
+
+        # Frame for Achieve / Delete / Achieve All / Delete All buttons
         self.all_goals_btn_frame = tk.Frame(self)
         self.all_goals_btn_frame.pack(fill="x", pady=(0,10))
+        self.achieve_btn = tk.Button(self.all_goals_btn_frame, text="Achieve", width=8,
+                                     command=self.achieve_selected_goal)
+        self.achieve_btn.pack(side="left", padx=5)
+        self.delete_btn = tk.Button(self.all_goals_btn_frame, text="Delete", width=8,
+                                    command=self.delete_selected_goal)
+        self.delete_btn.pack(side="left", padx=5)
+        self.achieve_all_btn = tk.Button(self.all_goals_btn_frame, text="Achieve All", width=12,
+                                         command=self.achieve_all_goals)
+        self.achieve_all_btn.pack(side="left", padx=5)
+        self.delete_all_btn = tk.Button(self.all_goals_btn_frame, text="Delete All", width=12,
+                                        command=self.delete_all_goals)
+        self.delete_all_btn.pack(side="left", padx=5)
         # Delete Budgets button
         ttk.Button(self, text="Delete Budgets", command=self.delete_budgets).pack(pady=5)
         # Back to Main Menu button at the bottom
         ttk.Button(self, text="Back to Main Menu", 
-                   command=lambda: controller.show_frame(MainMenuFrame)).pack(pady=5)
+                   command=functools.partial(controller.show_frame, MainMenuFrame)).pack(pady=5)
         self.update_goals_display()
 
     def refresh(self):
         """Update the summary text with current totals."""
+        if self._last_rev == self.controller.manager.rev:
+            return
+        self._last_rev = self.controller.manager.rev
         total_income = self.controller.manager.get_total_income()
         total_expense = self.controller.manager.get_total_expense()
         balance = self.controller.manager.get_available_funds()
@@ -459,35 +721,33 @@ class SummaryFrame(ttk.Frame):
         self.update_goals_display()
     
     def update_goals_display(self):
-        """Show all unachieved goals with Achieve/Delete buttons, and all-goals controls."""
-        for widget in self.goals_frame.winfo_children():
-            widget.destroy()
-        for widget in self.all_goals_btn_frame.winfo_children():
-            widget.destroy()
-
+        """Fill the goals table with all unachieved goals and update the goal buttons."""
+        self.goals_tree.delete(*self.goals_tree.get_children())
         goals = self.controller.manager.data.get('goals', [])
         for idx, goal in enumerate(goals):
             goal_name = goal.get('name') if isinstance(goal, dict) and 'name' in goal else str(goal)
             goal_amt = goal.get('amount') if isinstance(goal, dict) and 'amount' in goal else ""
-            row_frame = tk.Frame(self.goals_frame)
-            row_frame.pack(fill="x", padx=5, pady=2)
-            tk.Label(row_frame, text=f"{goal_name}  RM{goal_amt:.2f}", anchor="w", width=30).pack(side="left")
-            tk.Button(row_frame, text="Achieve", width=8,
-                      command=lambda i=idx: self.achieve_goal(i)).pack(side="left", padx=5)
-            tk.Button(row_frame, text="Delete", width=8,
-                      command=lambda i=idx: self.delete_goal(i)).pack(side="left", padx=5)
-
-        if goals:
-            tk.Button(self.all_goals_btn_frame, text="Achieve All", width=12,
-                      command=self.achieve_all_goals).pack(side="left", padx=5)
-            tk.Button(self.all_goals_btn_frame, text="Delete All", width=12,
-                      command=self.delete_all_goals).pack(side="left", padx=5)
+            amt_text = f"RM{goal_amt:.2f}" if isinstance(goal_amt, (int, float)) else ""
+            self.goals_tree.insert("", "end", iid=str(idx), values=(goal_name, amt_text))
+        self.update_goal_buttons()
+
+    def update_goal_buttons(self, event=None):
+        """Enable Achieve/Delete only with a selected goal, and the all-goals buttons only with goals."""
+        selected = 'normal' if self.goals_tree.selection() else 'disabled'
+        has_goals = 'normal' if self.goals_tree.get_children() else 'disabled'
+        self.achieve_btn.configure(state=selected)
+        self.delete_btn.configure(state=selected)
+        self.achieve_all_btn.configure(state=has_goals)
+        self.delete_all_btn.configure(state=has_goals)
+
+    def selected_goal_index(self):
+        selection = self.goals_tree.selection()
+        return int(selection[0]) if selection else None
 
     def delete_budgets(self):
         """Delete all budgets after confirmation."""
         if messagebox.askyesno("Confirm", "Delete ALL budgets?"):
-            self.controller.manager.data['budgets'] = []
-            self.controller.manager.save_data()
+            self.controller.manager.delete_budgets()
             messagebox.showinfo("Deleted", "All budgets have been deleted.")
             self.refresh()
 
@@ -513,22 +773,19 @@ class SummaryFrame(ttk.Frame):
         self.controller.manager.delete_goal(idx)
         self.update_goals_display()
 
+    def achieve_selected_goal(self):
+        idx = self.selected_goal_index()
+        if idx is not None:
+            self.achieve_goal(idx)
+
+    def delete_selected_goal(self):
+        idx = self.selected_goal_index()
+        if idx is not None:
+            self.delete_goal(idx)
+
     def achieve_all_goals(self):
-        goals = list(self.controller.manager.data.get('goals', []))  # Copy to avoid modification during iteration
-        balance = self.controller.manager.get_available_funds()
-        achieved = []
-        not_achieved = []
-        for idx, goal in enumerate(goals):
-            goal_name = goal.get('name') if isinstance(goal, dict) and 'name' in goal else str(goal)
-            goal_amt = goal.get('amount') if isinstance(goal, dict) and 'amount' in goal else 0
-            if goal_amt <= balance:
-                # Remove goal and add to expenses as "Goal (Goal Name)"
-                self.controller.manager.delete_goal(0)  # Always delete first since list shrinks
-                self.controller.manager.add_expense(f'Goal ("{goal_name}")', goal_amt)
-                balance -= goal_amt
-                achieved.append(goal_name)
-            else:
-                not_achieved.append(goal_name)
+        achieved, not_achieved = self.controller.manager.achieve_all_goals()
+        self.controller.manager.flush()
         self.update_goals_display()
         if achieved:
             messagebox.showinfo("Goals Achieved", f"Achieved goals: {', '.join(achieved)}")
@@ -544,6 +801,15 @@ class PieChartFrame(ttk.Frame):
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
+        self._last_rev = -1
+        # Artists from the last full pie draw, reused while the category set is unchanged
+        self._pie_categories = None
+        self._wedges = self._labels = self._autotexts = ()
+        # Matplotlib is slow to import, so load it only when the chart is first opened
+        import matplotlib
+        matplotlib.use("TkAgg")
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
 
         ttk.Label(self, text="Expenses by Category", font=("Helvetica", 14)).pack(pady=10)
         self.figure = Figure(figsize=(5,4), dpi=80)
@@ -551,26 +817,48 @@ class PieChartFrame(ttk.Frame):
         self.canvas = FigureCanvasTkAgg(self.figure, self)
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
         ttk.Button(self, text="Back to Main Menu", 
-                   command=lambda: controller.show_frame(MainMenuFrame)).pack(pady=5)
+                   command=functools.partial(controller.show_frame, MainMenuFrame)).pack(pady=5)
 
     def refresh(self):
         """Redraw the pie chart with current expense data."""
-        self.ax.clear()
-        data = self.controller.manager.data.get("expenses", [])
-        cat_sums = {}
-        for item in data:
-            cat = item["category"]
-            amt = item["amount"]
-            cat_sums[cat] = cat_sums.get(cat, 0) + amt
-        categories = list(cat_sums.keys())
-        amounts = list(cat_sums.values())
-        if categories and amounts:
-            self.ax.pie(amounts, labels=categories, autopct='%1.1f%%', startangle=90)
-            self.ax.axis('equal')  # keep chart circular
+        if self._last_rev == self.controller.manager.rev:
+            return
+        self._last_rev = self.controller.manager.rev
+        manager = self.controller.manager
+        categories, amounts = [], []
+        if manager.exp_cats:
+            categories, amounts = group_sum(manager.exp_cats, manager.exp_amounts)
+        if categories and categories == self._pie_categories:
+            self.update_pie(amounts)
         else:
-            self.ax.text(0.5, 0.5, "No expenses to display", 
-                         horizontalalignment='center', verticalalignment='center')
-        self.canvas.draw()
+            self.ax.clear()
+            if categories:
+                self._wedges, self._labels, self._autotexts = self.ax.pie(
+                    amounts, labels=categories, autopct='%1.1f%%', startangle=90)
+                self.ax.axis('equal')  # keep chart circular
+                self._pie_categories = categories
+            else:
+                self.ax.text(0.5, 0.5, "No expenses to display", 
+                             horizontalalignment='center', verticalalignment='center')
+                self._pie_categories = None
+        self.canvas.draw_idle()
+
+    def update_pie(self, amounts):
+        """Move the existing wedges and labels to new amounts, mirroring Axes.pie's layout."""
+        total = float(sum(amounts))
+        theta1 = 90.0
+        for wedge, label, pct, amt in zip(self._wedges, self._labels, self._autotexts, amounts):
+            frac = amt / total
+            theta2 = theta1 + 360 * frac
+            wedge.set_theta1(theta1)
+            wedge.set_theta2(theta2)
+            mid = math.radians((theta1 + theta2) / 2)
+            x, y = math.cos(mid), math.sin(mid)
+            label.set_position((1.1 * x, 1.1 * y))
+            label.set_horizontalalignment('left' if x > 0 else 'right')
+            pct.set_position((0.6 * x, 0.6 * y))
+            pct.set_text('%1.1f%%' % (100 * frac))
+            theta1 = theta2
 
 if __name__ == "__main__":
     app = FinanceFlowApp()